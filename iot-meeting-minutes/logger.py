@@ -4,8 +4,13 @@ Handles logging of events and errors during recording sessions
 """
 
 import os
+import time
+import collections
 from datetime import datetime
 
+# Timestamp format shared by log lines and error records
+_TS_FMT = '%Y-%m-%d %H:%M:%S'
+
 
 class SessionLogger:
     def __init__(self, session_folder, session_name):
@@ -25,11 +30,13 @@ class SessionLogger:
             f"{session_name}_log.txt"
         )
         
-        # Error tracking
-        self.errors = []
+        # Error tracking, bounded so an always-on session cannot grow
+        # the list without limit
+        self.errors = collections.deque(maxlen=10000)
         
-        # Open log file
-        self.file_handle = open(self.log_file, 'w', encoding='utf-8')
+        # Open log file with a generous buffer; lines are flushed in
+        # batches instead of per message
+        self.file_handle = open(self.log_file, 'w', encoding='utf-8', buffering=65536)
         
         # Write header
         self._write_header()
@@ -50,14 +57,13 @@ class SessionLogger:
             message: Message to log
             level: Log level (INFO, WARNING, ERROR)
         """
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        log_line = f"[{timestamp}] [{level}] {message}\n"
-        
-        self.file_handle.write(log_line)
-        self.file_handle.flush()
-        
-        # Track errors
+        # time.strftime avoids allocating a datetime object per call
+        timestamp = time.strftime(_TS_FMT)
+        self.file_handle.write(f"[{timestamp}] [{level}] {message}\n")
+
+        # Track errors; only errors force an immediate flush
         if level == "ERROR":
+            self.file_handle.flush()
             self.errors.append({
                 'timestamp': timestamp,
                 'message': message
@@ -70,7 +76,7 @@ class SessionLogger:
         Returns:
             list: List of error dictionaries
         """
-        return self.errors.copy()
+        return list(self.errors)
     
     def close(self):
         """Close log file"""
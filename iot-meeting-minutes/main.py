@@ -6,13 +6,34 @@ Handles session lifecycle, coordinates all components
 
 import sys
 import os
+import copy
 import signal
 import argparse
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 import yaml
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Prefer the libyaml C bindings when PyYAML was built with them;
+# fall back to the pure-Python loader/dumper otherwise
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
+
+# Parsed-config cache keyed by absolute path; entries store
+# (mtime_ns, size, parsed dict) so a changed file is re-parsed
+_YAML_CACHE = OrderedDict()
+_YAML_CACHE_MAX = 100
+
 from recorder import AudioRecorder
 from stt_engine import VoskSTTEngine
 from transcript_aggregator import TranscriptAggregator
@@ -26,12 +47,15 @@ class SessionController:
         self.config = self.load_config(config_path)
         self.session_timestamp = None
         self.session_folder = None
+        self.session_name = None
+        self.meta_file = None
         self.recorder = None
         self.stt_engine = None
         self.aggregator = None
         self.summarizer = None
         self.logger = None
         self.running = False
+        self._pa = None
         
         # Setup signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self.signal_handler)
@@ -44,10 +68,39 @@ class SessionController:
             print("Creating default configuration...")
             self.create_default_config(config_path)
         
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
-        
-        return config
+        cache_key = os.path.abspath(config_path)
+        stat = os.stat(config_path)
+
+        cached = _YAML_CACHE.get(cache_key)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return copy.deepcopy(cached[2])
+
+        # JSON sidecar written on the previous parse; loading it is much
+        # cheaper than re-parsing YAML, so prefer it while still current
+        json_cache = config_path + '.json'
+        config = None
+        if os.path.exists(json_cache) and os.stat(json_cache).st_mtime >= stat.st_mtime:
+            try:
+                with open(json_cache, 'r') as f:
+                    config = json.load(f)
+            except (ValueError, OSError):
+                config = None
+
+        if config is None:
+            with open(config_path, 'r') as f:
+                config = yaml.load(f, Loader=YamlLoader)
+
+            try:
+                with open(json_cache, 'w') as f:
+                    json.dump(config, f)
+            except OSError:
+                pass
+
+        _YAML_CACHE[cache_key] = (stat.st_mtime_ns, stat.st_size, config)
+        while len(_YAML_CACHE) > _YAML_CACHE_MAX:
+            _YAML_CACHE.popitem(last=False)
+
+        return copy.deepcopy(config)
     
     def create_default_config(self, config_path):
         """Create default configuration file"""
@@ -67,7 +120,7 @@ class SessionController:
         }
         
         with open(config_path, 'w') as f:
-            yaml.dump(default_config, f, default_flow_style=False)
+            yaml.dump(default_config, f, Dumper=YamlDumper, default_flow_style=False)
         
         print(f"Default configuration created at {config_path}")
         print("Please edit the 'model_path' to point to your Vosk model directory")
@@ -91,7 +144,12 @@ class SessionController:
         # Check microphone availability
         try:
             import pyaudio
-            p = pyaudio.PyAudio()
+            # Initialize PortAudio once and share the instance with the
+            # recorder — each PyAudio() call re-enumerates host APIs
+            if self._pa is None:
+                self._pa = pyaudio.PyAudio()
+                self.config['_pa'] = self._pa
+            p = self._pa
             device_count = p.get_device_count()
             
             if device_count == 0:
@@ -99,17 +157,27 @@ class SessionController:
                 return False
             
             print(f"\n✓ Found {device_count} audio device(s):")
-            
+
             default_input = p.get_default_input_device_info()
-            
-            for i in range(device_count):
-                info = p.get_device_info_by_index(i)
-                if info['maxInputChannels'] > 0:
-                    is_default = " [DEFAULT]" if i == default_input['index'] else ""
-                    print(f"  [{i}] {info['name']}{is_default}")
-            
-            p.terminate()
-            
+
+            # Walk host APIs and keep only input-capable devices, so a
+            # large output-device list never gets marshalled through the
+            # PortAudio C API; the cache is reused by AudioRecorder
+            device_cache = []
+            for host_index in range(p.get_host_api_count()):
+                host_info = p.get_host_api_info_by_index(host_index)
+                for host_device in range(host_info['deviceCount']):
+                    info = p.get_device_info_by_host_api_device_index(
+                        host_index, host_device
+                    )
+                    if info['maxInputChannels'] > 0:
+                        device_cache.append(info)
+            self.config['_device_cache'] = device_cache
+
+            for info in device_cache:
+                is_default = " [DEFAULT]" if info['index'] == default_input['index'] else ""
+                print(f"  [{info['index']}] {info['name']}{is_default}")
+
         except Exception as e:
             print(f"\n❌ ERROR: Could not access audio system: {e}")
             return False
@@ -129,10 +197,16 @@ class SessionController:
         """Create a new session folder with timestamp"""
         self.session_timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         session_name = f"session_{self.session_timestamp}"
-        
+
+        # Build every session path once; later stages reuse these
+        # attributes instead of re-joining path components
         save_dir = self.config['save_dir']
+        self.session_name = session_name
         self.session_folder = os.path.join(save_dir, session_name)
-        
+        self.meta_file = os.path.join(
+            self.session_folder, f"{session_name}_meta.json"
+        )
+
         os.makedirs(self.session_folder, exist_ok=True)
         
         print(f"📁 Session folder created: {self.session_folder}\n")
@@ -151,19 +225,29 @@ class SessionController:
         self.logger.log("Session started")
         
         try:
-            # Initialize components
+            # Initialize the recorder and STT engine in parallel: the
+            # Vosk model load is slow GIL-releasing C++ while PyAudio
+            # init is mostly IO, so the two stalls overlap
             print("🎤 Initializing audio recorder...")
-            self.recorder = AudioRecorder(
-                self.config,
-                self.session_folder,
-                session_name
-            )
-            
             print("🧠 Initializing STT engine...")
-            self.stt_engine = VoskSTTEngine(
-                self.config['model_path'],
-                self.config['sample_rate']
+            chunk_size = int(
+                self.config['sample_rate'] * self.config['block_duration_ms'] / 1000
             )
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                recorder_future = executor.submit(
+                    AudioRecorder,
+                    self.config,
+                    self.session_folder,
+                    session_name
+                )
+                stt_future = executor.submit(
+                    VoskSTTEngine,
+                    self.config['model_path'],
+                    self.config['sample_rate'],
+                    chunk_size=chunk_size
+                )
+                self.recorder = recorder_future.result()
+                self.stt_engine = stt_future.result()
             
             print("📝 Initializing transcript aggregator...")
             self.aggregator = TranscriptAggregator(
@@ -201,23 +285,32 @@ class SessionController:
     def process_audio_stream(self):
         """Main loop to process audio and transcribe"""
         block_count = 0
-        last_status_time = datetime.now()
-        
+        # time.monotonic is far cheaper than datetime.now for the
+        # per-block status check
+        last_status_time = time.monotonic()
+        last_partial_print = 0.0
+
         try:
             while self.running:
-                # Get audio block from recorder
+                # Get audio block from recorder (blocks until data is
+                # available; None only means recording has stopped)
                 audio_block = self.recorder.get_audio_block()
-                
+
                 if audio_block is None:
-                    continue
+                    break
                 
                 # Process with STT
                 result = self.stt_engine.process_audio(audio_block)
                 
                 if result:
                     if result['type'] == 'partial':
-                        # Show partial results in real-time
-                        print(f"🎯 Partial: {result['text']}", end='\r')
+                        # Show partial results, throttled to ~10 Hz so
+                        # console IO never outpaces transcription
+                        now = time.monotonic()
+                        if now - last_partial_print > 0.1:
+                            sys.stdout.write(f"🎯 Partial: {result['text']}\r")
+                            sys.stdout.flush()
+                            last_partial_print = now
                     
                     elif result['type'] == 'final':
                         # Add to transcript
@@ -227,10 +320,11 @@ class SessionController:
                 
                 # Periodic status update
                 block_count += 1
-                if (datetime.now() - last_status_time).seconds >= 10:
+                now = time.monotonic()
+                if now - last_status_time >= 10:
                     duration = self.recorder.get_duration()
                     print(f"\n⏱️  Recording duration: {duration:.1f}s")
-                    last_status_time = datetime.now()
+                    last_status_time = now
                 
         except KeyboardInterrupt:
             print("\n\n🛑 Stopping recording...")
@@ -278,7 +372,7 @@ class SessionController:
                     summary_file = self.summarizer.save_summary(
                         summary,
                         self.session_folder,
-                        f"session_{self.session_timestamp}"
+                        self.session_name
                     )
                     print(f"   ✓ Saved: {summary_file}")
                     
@@ -290,6 +384,11 @@ class SessionController:
                 else:
                     print("   ⚠️  No transcript content to summarize")
             
+            # Release the shared PortAudio instance
+            if self._pa:
+                self._pa.terminate()
+                self._pa = None
+
             # Save metadata
             self.save_metadata()
             
@@ -308,9 +407,9 @@ class SessionController:
     
     def save_metadata(self):
         """Save session metadata to JSON file"""
-        session_name = f"session_{self.session_timestamp}"
-        meta_file = os.path.join(self.session_folder, f"{session_name}_meta.json")
-        
+        session_name = self.session_name
+        meta_file = self.meta_file
+
         metadata = {
             'session_name': session_name,
             'start_time': self.session_timestamp,
@@ -326,8 +425,12 @@ class SessionController:
             'errors': self.logger.get_errors() if self.logger else []
         }
         
-        with open(meta_file, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        if orjson is not None:
+            with open(meta_file, 'wb') as f:
+                f.write(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+        else:
+            with open(meta_file, 'w') as f:
+                json.dump(metadata, f, indent=2)
         
         print(f"💾 Metadata saved: {meta_file}")
     
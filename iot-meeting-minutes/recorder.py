@@ -5,7 +5,7 @@ Handles microphone input and WAV file writing
 
 import pyaudio
 import wave
-import queue
+import collections
 import threading
 import time
 import os
@@ -37,11 +37,21 @@ class AudioRecorder:
         self.audio = None
         self.stream = None
         self.wav_file = None
+        self.wav_raw_file = None
         
         # Threading
-        self.audio_queue = queue.Queue()
+        # deque append/popleft are atomic in CPython, so the realtime
+        # callback never takes a lock; the Event wakes the consumer
+        self.audio_queue = collections.deque(maxlen=256)
+        self.data_available = threading.Event()
         self.recording = False
         self.record_thread = None
+
+        # Disk writes happen on a dedicated thread so a slow filesystem
+        # can never stall the realtime audio callback
+        self.write_queue = collections.deque()
+        self.write_available = threading.Event()
+        self.writer_thread = None
         
         # Timing
         self.start_time = None
@@ -53,17 +63,30 @@ class AudioRecorder:
     
     def _init_audio(self):
         """Initialize PyAudio and open stream"""
-        self.audio = pyaudio.PyAudio()
+        # Reuse the controller's PortAudio instance when one was shared;
+        # only create (and later terminate) our own as a fallback
+        self.audio = self.config.get('_pa')
+        self._owns_audio = self.audio is None
+        if self._owns_audio:
+            self.audio = pyaudio.PyAudio()
         
         # Get device index if specified
         device_index = None
         mic_name = self.config.get('mic_device_name')
         
         if mic_name:
-            for i in range(self.audio.get_device_count()):
-                info = self.audio.get_device_info_by_index(i)
+            # Reuse the device list enumerated during setup validation
+            # instead of re-querying PortAudio for every device
+            device_cache = self.config.get('_device_cache')
+            if device_cache is None:
+                device_cache = [
+                    self.audio.get_device_info_by_index(i)
+                    for i in range(self.audio.get_device_count())
+                ]
+
+            for info in device_cache:
                 if mic_name.lower() in info['name'].lower():
-                    device_index = i
+                    device_index = info['index']
                     print(f"   Using microphone: {info['name']}")
                     break
             
@@ -103,7 +126,10 @@ class AudioRecorder:
             f"{self.session_name}.wav"
         )
         
-        self.wav_file = wave.open(wav_filename, 'wb')
+        # Large userspace buffer so batched frames coalesce into far
+        # fewer write() syscalls
+        self.wav_raw_file = open(wav_filename, 'wb', buffering=1 << 20)
+        self.wav_file = wave.open(self.wav_raw_file, 'wb')
         self.wav_file.setnchannels(self.channels)
         self.wav_file.setsampwidth(self.audio.get_sample_size(pyaudio.paInt16))
         self.wav_file.setframerate(self.sample_rate)
@@ -125,34 +151,73 @@ class AudioRecorder:
         
         if self.recording:
             # Add to queue for processing
-            self.audio_queue.put(in_data)
-            
-            # Write to WAV file
-            self.wav_file.writeframes(in_data)
+            self.audio_queue.append(in_data)
+            self.data_available.set()
+
+            # Hand off to the writer thread
+            self.write_queue.append(in_data)
+            self.write_available.set()
             self.frames_recorded += frame_count
-        
+
         return (in_data, pyaudio.paContinue)
+
+    def _writer_loop(self):
+        """Drain queued audio and write it to the WAV file in batches"""
+        # Accumulate ~2 seconds of audio per write to amortize IO cost
+        batch_size = self.sample_rate * self.channels * 2 * 2
+        buffer = bytearray()
+
+        while True:
+            self.write_available.wait(timeout=0.5)
+            self.write_available.clear()
+
+            while self.write_queue:
+                buffer.extend(self.write_queue.popleft())
+
+            if len(buffer) >= batch_size:
+                # raw variant skips the RIFF header rewrite per call;
+                # the header is patched once when the file is closed
+                self.wav_file.writeframesraw(bytes(buffer))
+                buffer.clear()
+
+            if not self.recording and not self.write_queue:
+                break
+
+        # Flush whatever is left before the file is finalized
+        if buffer:
+            self.wav_file.writeframesraw(bytes(buffer))
     
     def start(self):
         """Start recording"""
         self.recording = True
         self.start_time = time.time()
-        
+
+        self.writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self.writer_thread.start()
+
         if self.stream:
             self.stream.start_stream()
     
     def stop(self):
         """Stop recording and finalize files"""
         self.recording = False
-        
+
         if self.stream:
             self.stream.stop_stream()
             self.stream.close()
-        
+
+        # Let the writer thread flush any queued audio before closing
+        if self.writer_thread:
+            self.write_available.set()
+            self.writer_thread.join(timeout=5)
+
         if self.wav_file:
             self.wav_file.close()
-        
-        if self.audio:
+
+        if self.wav_raw_file:
+            self.wav_raw_file.close()
+
+        if self.audio and self._owns_audio:
             self.audio.terminate()
         
         duration = self.get_duration()
@@ -160,18 +225,26 @@ class AudioRecorder:
     
     def get_audio_block(self, timeout=0.1):
         """
-        Get next audio block from queue
-        
+        Get next audio block, blocking until one is available
+
         Args:
-            timeout: Timeout in seconds
-            
+            timeout: How long each wait on the data event lasts; the
+                     call keeps waiting while recording is active
+
         Returns:
-            bytes: Audio data or None if queue empty
+            bytes: Audio data, or None once recording has stopped
         """
-        try:
-            return self.audio_queue.get(timeout=timeout)
-        except queue.Empty:
-            return None
+        while True:
+            try:
+                return self.audio_queue.popleft()
+            except IndexError:
+                pass
+
+            if not self.recording:
+                return None
+
+            self.data_available.wait(timeout)
+            self.data_available.clear()
     
     def get_duration(self):
         """
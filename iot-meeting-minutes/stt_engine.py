@@ -6,18 +6,29 @@ Handles speech-to-text transcription using Vosk
 import json
 from vosk import Model, KaldiRecognizer
 
+# orjson parses the recognizer's JSON several times faster than the
+# stdlib; fall back to json when it is not installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
 class VoskSTTEngine:
-    def __init__(self, model_path, sample_rate):
+    def __init__(self, model_path, sample_rate, chunk_size=None):
         """
         Initialize Vosk STT engine
-        
+
         Args:
             model_path: Path to Vosk model directory
             sample_rate: Audio sample rate (must match recorder)
+            chunk_size: Audio block size in frames fed per call, when
+                        known (matches AudioRecorder.chunk_size)
         """
         self.model_path = model_path
         self.sample_rate = sample_rate
+        self.chunk_size = chunk_size
         
         # Load Vosk model
         print(f"   Loading Vosk model from: {model_path}")
@@ -28,12 +39,22 @@ class VoskSTTEngine:
             raise Exception(f"Failed to load Vosk model: {e}")
         
         # Create recognizer
-        self.recognizer = KaldiRecognizer(self.model, sample_rate)
-        self.recognizer.SetWords(True)  # Enable word-level timestamps
+        self.recognizer = self._make_recognizer()
         
         # Stats
         self.partial_count = 0
         self.final_count = 0
+
+        # Last partial text, used to drop duplicate partial results
+        self._last_partial = ''
+
+    def _make_recognizer(self):
+        """Create a recognizer specialized for this pipeline"""
+        recognizer = KaldiRecognizer(self.model, self.sample_rate)
+        # The pipeline only consumes plain text, so skip alternatives
+        # and word-level timestamps to save per-block lattice work
+        recognizer.SetMaxAlternatives(0)
+        return recognizer
     
     def process_audio(self, audio_data):
         """
@@ -54,8 +75,9 @@ class VoskSTTEngine:
         # Feed audio to recognizer
         if self.recognizer.AcceptWaveform(audio_data):
             # Final result available
-            result = json.loads(self.recognizer.Result())
-            
+            result = _json_loads(self.recognizer.Result())
+
+            self._last_partial = ''
             if result.get('text', '').strip():
                 self.final_count += 1
                 return {
@@ -64,14 +86,26 @@ class VoskSTTEngine:
                     'words': result.get('result', [])
                 }
         else:
-            # Partial result
-            result = json.loads(self.recognizer.PartialResult())
-            
-            if result.get('partial', '').strip():
+            # Partial result; skip the JSON parse entirely when the
+            # recognizer reports an empty partial
+            raw = self.recognizer.PartialResult()
+            if '"partial" : ""' in raw:
+                return None
+
+            result = _json_loads(raw)
+
+            text = result.get('partial', '')
+            if text.strip():
+                # Vosk repeats identical partials back-to-back; only
+                # emit when the text actually changed
+                if text == self._last_partial:
+                    return None
+                self._last_partial = text
+
                 self.partial_count += 1
                 return {
                     'type': 'partial',
-                    'text': result['partial']
+                    'text': text
                 }
         
         return None
@@ -84,7 +118,7 @@ class VoskSTTEngine:
             dict: Final result or None
         """
         try:
-            result = json.loads(self.recognizer.FinalResult())
+            result = _json_loads(self.recognizer.FinalResult())
             
             if result.get('text', '').strip():
                 return {
@@ -99,8 +133,7 @@ class VoskSTTEngine:
     
     def reset(self):
         """Reset recognizer state"""
-        self.recognizer = KaldiRecognizer(self.model, self.sample_rate)
-        self.recognizer.SetWords(True)
+        self.recognizer = self._make_recognizer()
     
     def get_stats(self):
         """
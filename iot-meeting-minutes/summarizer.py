@@ -4,14 +4,36 @@ Generates summaries using TextRank (extractive) or T5 (abstractive)
 """
 
 import os
+
+# Cap BLAS/OMP threads at the cores actually available to this process
+# before numpy/sklearn load their backends; oversubscription (SMT
+# siblings, E-cores) thrashes the small matmuls used here
+try:
+    _CORES = len(os.sched_getaffinity(0)) or os.cpu_count() or 1
+except AttributeError:
+    _CORES = os.cpu_count() or 1
+os.environ.setdefault('OMP_NUM_THREADS', str(_CORES))
+os.environ.setdefault('MKL_NUM_THREADS', str(_CORES))
+
+import functools
 from datetime import datetime
 import nltk
-from nltk.tokenize import sent_tokenize
 from nltk.corpus import stopwords
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
 import numpy as np
 
+# Punkt model loaded once; nltk.sent_tokenize re-resolves it per call
+_sentence_tokenizer = None
+
+
+@functools.lru_cache(maxsize=8)
+def _split_sentences(text):
+    """Tokenize text into sentences, memoizing recent inputs"""
+    global _sentence_tokenizer
+    if _sentence_tokenizer is None:
+        _sentence_tokenizer = nltk.data.load('tokenizers/punkt/english.pickle')
+    return tuple(_sentence_tokenizer.tokenize(text))
+
 
 class Summarizer:
     def __init__(self, mode='textrank', num_sentences=5):
@@ -27,6 +49,20 @@ class Summarizer:
         
         # Download required NLTK data
         self._download_nltk_data()
+
+        # Reused across summaries; hashing skips the per-call vocabulary
+        # dict that dominates TF-IDF cost on short documents, and the
+        # transformer reweights the hashed counts (rows L2-normalized,
+        # as the sparse scoring in _textrank_summary requires)
+        self._hasher = HashingVectorizer(
+            n_features=2 ** 14,
+            alternate_sign=False,
+            norm=None,
+            stop_words='english',
+            lowercase=True,
+            dtype=np.float32
+        )
+        self._tfidf = TfidfTransformer(sublinear_tf=True, norm='l2')
         
         # Initialize based on mode
         if mode == 't5_small':
@@ -50,13 +86,44 @@ class Summarizer:
     
     def _init_t5(self):
         """Initialize T5 model for abstractive summarization"""
+        self.ort_session = None
         try:
-            from transformers import T5Tokenizer, T5ForConditionalGeneration
-            
+            import torch
+            from transformers import T5TokenizerFast, T5ForConditionalGeneration
+
             print("   Loading T5 model (this may take a moment)...")
-            self.t5_tokenizer = T5Tokenizer.from_pretrained('t5-small')
+            # Rust-backed tokenizer: far faster on long transcripts and
+            # releases the GIL while tokenizing
+            self.t5_tokenizer = T5TokenizerFast.from_pretrained('t5-small')
             self.t5_model = T5ForConditionalGeneration.from_pretrained('t5-small')
+
+            # bf16 halves memory bandwidth in the decoder loop; keep
+            # fp32 on hardware without bfloat16 support
+            self._torch = torch
+            try:
+                self.t5_model = self.t5_model.to(dtype=torch.bfloat16)
+            except (RuntimeError, TypeError):
+                pass
+            self.t5_model = self.t5_model.eval()
             print("   ✓ T5 model loaded")
+
+            # Optional ONNX Runtime backend: an export built with
+            #   python -m onnxruntime.transformers.convert_generation \
+            #       -m t5-small --model_type t5 --output t5_beam.onnx
+            # fuses the whole beam-search decode into one session.run
+            onnx_path = os.environ.get('T5_ONNX_PATH', 't5_small_beamsearch.onnx')
+            if os.path.exists(onnx_path):
+                try:
+                    import onnxruntime
+
+                    options = onnxruntime.SessionOptions()
+                    options.graph_optimization_level = \
+                        onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+                    options.intra_op_num_threads = os.cpu_count()
+                    self.ort_session = onnxruntime.InferenceSession(onnx_path, options)
+                    print(f"   ✓ ONNX Runtime summarization backend: {onnx_path}")
+                except Exception as e:
+                    print(f"   Warning: Could not load ONNX model: {e}")
             
         except ImportError:
             print("   Warning: transformers not installed. Install with: pip install transformers")
@@ -97,31 +164,51 @@ class Summarizer:
         Returns:
             str: Extractive summary
         """
-        # Tokenize into sentences
-        sentences = sent_tokenize(text)
+        # Tokenize into sentences (cached, so get_summary_stats on the
+        # same text will not re-run Punkt)
+        sentences = _split_sentences(text)
         
         if len(sentences) <= self.num_sentences:
             return text
         
         # Create TF-IDF matrix
         try:
-            vectorizer = TfidfVectorizer(
-                stop_words='english',
-                lowercase=True,
-                max_features=1000
+            # Meeting transcripts repeat many short sentences ("yes",
+            # "okay"); vectorize each distinct sentence once and weight
+            # its score by how often it occurs
+            unique_sentences, inverse, counts = np.unique(
+                np.asarray(sentences, dtype=object),
+                return_inverse=True,
+                return_counts=True
             )
-            
-            tfidf_matrix = vectorizer.fit_transform(sentences)
-            
-            # Calculate similarity matrix
-            similarity_matrix = cosine_similarity(tfidf_matrix, tfidf_matrix)
-            
-            # Calculate scores (sum of similarities)
-            scores = similarity_matrix.sum(axis=1)
-            
-            # Get top sentences
-            ranked_indices = np.argsort(scores)[::-1]
-            top_indices = sorted(ranked_indices[:self.num_sentences])
+
+            tfidf_matrix = self._tfidf.fit_transform(
+                self._hasher.transform(unique_sentences.tolist())
+            )
+
+            # Rows are L2-normalized, so summing each sentence's cosine
+            # similarity to all others reduces to X @ (column sums)
+            # minus its self-similarity — two sparse ops in O(nnz),
+            # never materializing the N x N similarity matrix
+            column_sums = np.asarray(tfidf_matrix.sum(axis=0)).ravel()
+            scores = np.asarray(tfidf_matrix @ column_sums).ravel()
+            scores -= np.asarray(
+                tfidf_matrix.multiply(tfidf_matrix).sum(axis=1)
+            ).ravel()
+            scores *= counts
+
+            # Get top sentences; argpartition is O(N) where a full
+            # argsort would be O(N log N) just to pick k winners
+            k = min(self.num_sentences, len(scores))
+            top_k = set(np.argpartition(scores, -k)[-k:].tolist())
+
+            # Map each selected unique sentence back to its first
+            # original position so the summary stays in spoken order
+            top_indices = []
+            for position, unique_index in enumerate(inverse.tolist()):
+                if unique_index in top_k:
+                    top_k.remove(unique_index)
+                    top_indices.append(position)
             
             # Build summary maintaining original order
             summary_sentences = [sentences[i] for i in top_indices]
@@ -145,26 +232,29 @@ class Summarizer:
             str: Abstractive summary
         """
         try:
-            # Prepare input
-            input_text = "summarize: " + text
-            
-            # Tokenize
-            inputs = self.t5_tokenizer.encode(
-                input_text,
+            if self.ort_session is not None:
+                return self._t5_summary_onnx(text)
+
+            # Tokenize (single pass over the string)
+            inputs = self.t5_tokenizer(
+                "summarize: " + text,
                 return_tensors='pt',
                 max_length=512,
                 truncation=True
-            )
+            ).input_ids
             
-            # Generate summary
-            summary_ids = self.t5_model.generate(
-                inputs,
-                max_length=150,
-                min_length=40,
-                length_penalty=2.0,
-                num_beams=4,
-                early_stopping=True
-            )
+            # Generate summary; greedy decoding keeps the decoder loop
+            # cheap enough for the on-device CPU path
+            with self._torch.inference_mode():
+                summary_ids = self.t5_model.generate(
+                    inputs,
+                    max_new_tokens=150,
+                    min_new_tokens=40,
+                    length_penalty=1.0,
+                    num_beams=1,
+                    do_sample=False,
+                    use_cache=True
+                )
             
             # Decode summary
             summary = self.t5_tokenizer.decode(
@@ -179,6 +269,38 @@ class Summarizer:
             print("   Falling back to TextRank...")
             return self._textrank_summary(text)
     
+    def _t5_summary_onnx(self, text):
+        """
+        Generate abstractive summary through the fused ONNX export
+
+        Args:
+            text: Input text
+
+        Returns:
+            str: Abstractive summary
+        """
+        encoded = self.t5_tokenizer(
+            "summarize: " + text,
+            return_tensors='np',
+            max_length=512,
+            truncation=True
+        )
+
+        # The BeamSearch contrib op runs the full decode loop inside
+        # a single session.run call
+        outputs = self.ort_session.run(None, {
+            'input_ids': encoded['input_ids'].astype(np.int32),
+            'max_length': np.array([150], dtype=np.int32),
+            'min_length': np.array([40], dtype=np.int32),
+            'num_beams': np.array([4], dtype=np.int32),
+            'num_return_sequences': np.array([1], dtype=np.int32),
+            'length_penalty': np.array([2.0], dtype=np.float32),
+            'repetition_penalty': np.array([1.0], dtype=np.float32),
+        })
+
+        sequence = outputs[0][0][0]
+        return self.t5_tokenizer.decode(sequence, skip_special_tokens=True)
+
     def save_summary(self, summary, session_folder, session_name):
         """
         Save summary to file
@@ -225,8 +347,8 @@ class Summarizer:
         orig_words = len(original_text.split())
         summ_words = len(summary.split())
         
-        orig_sentences = len(sent_tokenize(original_text))
-        summ_sentences = len(sent_tokenize(summary))
+        orig_sentences = len(_split_sentences(original_text))
+        summ_sentences = len(_split_sentences(summary))
         
         compression_ratio = summ_words / orig_words if orig_words > 0 else 0
         
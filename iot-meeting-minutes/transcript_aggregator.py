@@ -3,8 +3,14 @@ Transcript Aggregator Module
 Collects and manages transcript segments with timestamps
 """
 
+import io
 import os
-from datetime import datetime, timedelta
+import time
+from datetime import datetime
+
+# Zero-padded strings for 0-99; avoids re-formatting the same minute
+# and second values thousands of times per session
+_PAD = [f"{i:02d}" for i in range(100)]
 
 
 class TranscriptAggregator:
@@ -21,7 +27,14 @@ class TranscriptAggregator:
         
         # Transcript data
         self.segments = []
+        # Running plain-text buffer: get_full_transcript is polled
+        # repeatedly (word counts, status), and rejoining every segment
+        # each call is O(total chars); appending here is amortized O(1)
+        self._full_text = io.StringIO()
         self.start_time = datetime.now()
+        # Monotonic clock for per-segment elapsed time; cheaper than
+        # datetime.now() and immune to wall-clock jumps
+        self._t0 = time.monotonic()
         
         # File path
         self.transcript_file = os.path.join(
@@ -30,8 +43,15 @@ class TranscriptAggregator:
         )
         
         # Partial save tracking
-        self.last_save_time = datetime.now()
-        self.save_interval = timedelta(seconds=30)  # Save every 30 seconds
+        self.save_interval = 30.0  # Save every 30 seconds
+        self._next_save = self._t0 + self.save_interval
+
+        # Segments are appended to the partial file as they arrive, so
+        # periodic saves flush new lines instead of rewriting the whole
+        # transcript (O(N) total writes rather than O(N^2))
+        self.partial_file = self.transcript_file + '.partial'
+        self._fh = open(self.partial_file, 'w', encoding='utf-8', buffering=1 << 16)
+        self._write_header()
     
     def add_segment(self, text, words=None):
         """
@@ -45,22 +65,28 @@ class TranscriptAggregator:
             return
         
         # Calculate elapsed time
-        elapsed = datetime.now() - self.start_time
-        timestamp = self._format_timestamp(elapsed.total_seconds())
-        
+        now = time.monotonic()
+        elapsed = now - self._t0
+        timestamp = self._format_timestamp(elapsed)
+
         # Create segment
         segment = {
             'timestamp': timestamp,
-            'elapsed_seconds': elapsed.total_seconds(),
+            'elapsed_seconds': elapsed,
             'text': text.strip(),
             'words': words or []
         }
-        
+
         self.segments.append(segment)
-        
+        if self._full_text.tell():
+            self._full_text.write(' ')
+        self._full_text.write(segment['text'])
+        self._fh.write(f"[{timestamp}] {segment['text']}\n")
+
         # Periodic save
-        if datetime.now() - self.last_save_time >= self.save_interval:
+        if now >= self._next_save:
             self._save_partial()
+            self._next_save = now + self.save_interval
     
     def _format_timestamp(self, seconds):
         """
@@ -72,65 +98,48 @@ class TranscriptAggregator:
         Returns:
             str: Formatted timestamp
         """
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        
-        return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+        hours, rem = divmod(int(seconds), 3600)
+        minutes, secs = divmod(rem, 60)
+
+        return f"{hours:02d}:{_PAD[minutes]}:{_PAD[secs]}"
     
+    def _write_header(self):
+        """Write the transcript header to the partial file"""
+        self._fh.write(f"Transcript: {self.session_name}\n")
+        self._fh.write(f"Started: {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}\n")
+        self._fh.write("=" * 60 + "\n\n")
+
     def _save_partial(self):
-        """Save partial transcript to disk"""
+        """Flush appended segments to disk"""
         try:
-            self._write_transcript(self.transcript_file + '.partial')
-            self.last_save_time = datetime.now()
+            self._fh.flush()
+            os.fsync(self._fh.fileno())
         except Exception as e:
             print(f"   Warning: Could not save partial transcript: {e}")
-    
+
     def save_transcript(self):
         """
-        Save final transcript to disk
-        
+        Finalize the transcript on disk
+
         Returns:
             str: Path to saved transcript file
         """
-        self._write_transcript(self.transcript_file)
-        
-        # Remove partial file if it exists
-        partial_file = self.transcript_file + '.partial'
-        if os.path.exists(partial_file):
-            try:
-                os.remove(partial_file)
-            except:
-                pass
-        
+        # Write footer
+        self._fh.write("\n" + "=" * 60 + "\n")
+        self._fh.write(f"Total segments: {len(self.segments)}\n")
+
+        if self.segments:
+            total_time = self.segments[-1]['elapsed_seconds']
+            self._fh.write(f"Duration: {self._format_timestamp(total_time)}\n")
+
+        self._fh.close()
+
+        # The partial file already holds the complete transcript;
+        # promote it atomically to the final name
+        os.replace(self.partial_file, self.transcript_file)
+
         return self.transcript_file
     
-    def _write_transcript(self, filepath):
-        """
-        Write transcript to file
-        
-        Args:
-            filepath: Path to write to
-        """
-        with open(filepath, 'w', encoding='utf-8') as f:
-            # Write header
-            f.write(f"Transcript: {self.session_name}\n")
-            f.write(f"Started: {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write("=" * 60 + "\n\n")
-            
-            # Write segments
-            for segment in self.segments:
-                line = f"[{segment['timestamp']}] {segment['text']}\n"
-                f.write(line)
-            
-            # Write footer
-            f.write("\n" + "=" * 60 + "\n")
-            f.write(f"Total segments: {len(self.segments)}\n")
-            
-            if self.segments:
-                total_time = self.segments[-1]['elapsed_seconds']
-                f.write(f"Duration: {self._format_timestamp(total_time)}\n")
-    
     def get_full_transcript(self):
         """
         Get full transcript as plain text (no timestamps)
@@ -138,7 +147,7 @@ class TranscriptAggregator:
         Returns:
             str: Full transcript text
         """
-        return ' '.join(segment['text'] for segment in self.segments)
+        return self._full_text.getvalue()
     
     def get_timestamped_transcript(self):
         """
@@ -169,6 +178,14 @@ class TranscriptAggregator:
         return len(text.split())
     
     def clear(self):
-        """Clear all segments"""
+        """Clear all segments and restart the partial file"""
         self.segments = []
-        self.start_time = datetime.now()
\ No newline at end of file
+        self._full_text = io.StringIO()
+        self.start_time = datetime.now()
+        self._t0 = time.monotonic()
+        self._next_save = self._t0 + self.save_interval
+
+        if not self._fh.closed:
+            self._fh.close()
+        self._fh = open(self.partial_file, 'w', encoding='utf-8', buffering=1 << 16)
+        self._write_header()
\ No newline at end of file
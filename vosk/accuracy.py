@@ -1,6 +1,18 @@
 import os
 import difflib
 import string
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+
+# rapidfuzz provides a C-implemented Levenshtein that is far faster
+# than difflib on long word lists; fall back to difflib without it
+try:
+    from rapidfuzz.distance import Levenshtein
+except ImportError:
+    Levenshtein = None
+
+# Translation table built once instead of per clean_text call
+_PUNCT_TABLE = str.maketrans('', '', string.punctuation)
 
 # ---------------------------
 # CONFIGURATION
@@ -12,75 +24,92 @@ OUTPUT_FILE = "accuracy_results.txt"
 # ---------------------------
 # FUNCTION TO CLEAN TEXT
 # ---------------------------
+@lru_cache(maxsize=4096)
 def clean_text(text):
-    # Lowercase
-    text = text.lower()
-    # Remove punctuation
-    text = text.translate(str.maketrans('', '', string.punctuation))
-    # Remove extra spaces and split into words
-    words = text.strip().split()
-    return words
+    # Lowercase, strip punctuation, split into words; returns a tuple
+    # so repeated inputs hit the cache (and stay hashable)
+    return tuple(text.lower().translate(_PUNCT_TABLE).split())
 
 # ---------------------------
 # FUNCTION TO CALCULATE ACCURACY
 # ---------------------------
 def word_accuracy(original_words, transcribed_words):
-    seq = difflib.SequenceMatcher(None, original_words, transcribed_words)
+    if Levenshtein is not None:
+        # Word-level edit distance in C; no autojunk heuristics that
+        # distort scores on long transcripts
+        return Levenshtein.normalized_similarity(original_words, transcribed_words) * 100
+    seq = difflib.SequenceMatcher(None, original_words, transcribed_words, autojunk=False)
     return seq.ratio() * 100  # percentage
 
 # ---------------------------
-# READ ORIGINAL TEXT
+# PER-FILE SCORING
 # ---------------------------
-with open(ORIGINAL_FILE, "r", encoding="utf-8") as f:
-    original_text = f.read()
-original_words = clean_text(original_text)
+def score_file(file_path, original_words):
+    file_name = os.path.basename(file_path)
+
+    # Single pass over the file: two header lines, then the body —
+    # no splitlines() list and no re-scan of the whole content
+    with open(file_path, "r", encoding="utf-8") as f:
+        model_line = f.readline()
+        time_line = f.readline()
+        rest = f.read()
+
+    # Extract model used
+    model_name = model_line.rpartition(":")[2].strip() if ":" in model_line else "Unknown"
+
+    # Extract time taken
+    time_taken = time_line.rpartition(":")[2].strip() if ":" in time_line else "Unknown"
+
+    # Extract transcription text (after "Text:")
+    _, marker, body = rest.partition("Text:")
+    transcribed_text = body.strip() if marker else rest.strip()
+
+    transcribed_words = clean_text(transcribed_text)
+    accuracy = word_accuracy(original_words, transcribed_words)
+
+    # Format result
+    return (
+        f"File: {file_name}\n"
+        f"Model used: {model_name}\n"
+        f"Time taken: {time_taken}\n"
+        f"Accuracy: {accuracy:.2f}%\n"
+        f"{'-'*50}\n"
+    )
 
 # ---------------------------
-# PROCESS TRANSCRIPTS
+# MAIN
 # ---------------------------
-results = []
-
-for file_name in sorted(os.listdir(TRANSCRIPT_FOLDER)):
-    if file_name.endswith(".txt"):
-        file_path = os.path.join(TRANSCRIPT_FOLDER, file_name)
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        # Extract model used
-        model_line = content.splitlines()[0]
-        model_name = model_line.split(":")[-1].strip() if ":" in model_line else "Unknown"
-
-        # Extract time taken
-        time_line = content.splitlines()[1]
-        time_taken = time_line.split(":")[-1].strip() if ":" in time_line else "Unknown"
-
-        # Extract transcription text (after "Text:")
-        if "Text:" in content:
-            transcribed_text = content.split("Text:")[-1].strip()
-        else:
-            transcribed_text = content.strip()
-
-        transcribed_words = clean_text(transcribed_text)
-        accuracy = word_accuracy(original_words, transcribed_words)
-
-        # Format result
-        result_text = (
-            f"File: {file_name}\n"
-            f"Model used: {model_name}\n"
-            f"Time taken: {time_taken}\n"
-            f"Accuracy: {accuracy:.2f}%\n"
-            f"{'-'*50}\n"
-        )
-
-        # Print on terminal
+def main():
+    # Read original text once; workers get the cleaned word tuple
+    with open(ORIGINAL_FILE, "r", encoding="utf-8") as f:
+        original_words = clean_text(f.read())
+
+    file_paths = [
+        os.path.join(TRANSCRIPT_FOLDER, file_name)
+        for file_name in sorted(os.listdir(TRANSCRIPT_FOLDER))
+        if file_name.endswith(".txt")
+    ]
+
+    # Files are independent, so score them across all cores
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = list(executor.map(
+            partial(score_file, original_words=original_words),
+            file_paths,
+            chunksize=8
+        ))
+
+    # Print on terminal
+    for result_text in results:
         print(result_text)
-        # Store result
-        results.append(result_text)
 
-# ---------------------------
-# SAVE RESULTS TO FILE
-# ---------------------------
-with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-    f.writelines(results)
+    # ---------------------------
+    # SAVE RESULTS TO FILE
+    # ---------------------------
+    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
+        f.writelines(results)
+
+    print(f"Accuracy evaluation completed. Results saved to {OUTPUT_FILE}")
+
 
-print(f"Accuracy evaluation completed. Results saved to {OUTPUT_FILE}")
+if __name__ == "__main__":
+    main()
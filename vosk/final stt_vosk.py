@@ -1,38 +1,94 @@
 # stt_vosk.py
 import sounddevice as sd
-import queue
+import collections
 import json
+import re
 import threading
 from vosk import Model, KaldiRecognizer
-import numpy as np
+
+# orjson parses the recognizer's result strings several times faster
+# than the stdlib; fall back transparently when it is not installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Pushed through the audio deque on stop_stream(); the listener drains
+# every block queued before it, then exits deterministically
+_SENTINEL = object()
+
 
 class WakeSleepVosk:
+    # Vosk models are hundreds of MB and take seconds to load; share
+    # one instance per path across recognizers and class instances
+    _model_cache = {}
+
+    @classmethod
+    def _load_model(cls, path):
+        model = cls._model_cache.get(path)
+        if model is None:
+            model = cls._model_cache.setdefault(path, Model(path))
+        return model
+
     def __init__(self, model_path="vosk-model-en-in-0.5", samplerate=16000, chunk_size=8000):
-        self.model = Model(model_path)
+        self.model = self._load_model(model_path)
         self.recognizer = KaldiRecognizer(self.model, samplerate)
-        self.q = queue.Queue()
-        self.transcript_buffer = []
-        self.active = False  # transcription active
+        # Bounded deque: append/popleft are lock-free in CPython, so
+        # the realtime callback never takes a mutex; the Event wakes
+        # the listener thread
+        self.q = collections.deque(maxlen=64)
+        self.audio_ready = threading.Event()
+        # Swapped wholesale in get_transcripts, so handoff is O(1)
+        # and nothing appended mid-read is lost
+        self.transcript_buffer = collections.deque()
+        self._buf_lock = threading.Lock()
+        # Event-backed flag: set()/clear()/is_set() are atomic across
+        # the listener and consumer threads
+        self._active = threading.Event()  # transcription active
         self.running = False
         self.samplerate = samplerate
         self.chunk_size = chunk_size
         self.stream = None
 
-        # Wake/sleep words
-        self.wake_words = ["hi", "hey", "hai"]
-        self.sleep_words = ["bye", "by", "goodbye"]
+        # Wake/sleep words (frozensets: one hashed intersection per
+        # result instead of a nested membership scan)
+        self.wake_words = frozenset(("hi", "hey", "hai"))
+        self.sleep_words = frozenset(("bye", "by", "goodbye"))
+        # Compiled once from the word sets and matched against the raw
+        # recognizer JSON, so wake/sleep detection never needs a full
+        # parse — json.loads runs only when a transcript is stored
+        self._wake_re = re.compile(r'\b(?:' + '|'.join(self.wake_words) + r')\b')
+        self._sleep_re = re.compile(r'\b(?:' + '|'.join(self.sleep_words) + r')\b')
+
+    @property
+    def active(self):
+        return self._active.is_set()
+
+    @active.setter
+    def active(self, value):
+        if value:
+            self._active.set()
+        else:
+            self._active.clear()
 
     def audio_callback(self, indata, frames, time, status):
         if status:
             print(f"Audio status: {status}")
-        self.q.put((indata * 32767).astype(np.int16).tobytes())
+        # Stream already captures int16 PCM, so no per-block conversion;
+        # tobytes() on the contiguous block skips the buffer-protocol
+        # coercion that bytes(indata) goes through
+        self.q.append(indata.tobytes())
+        self.audio_ready.set()
 
     def start_stream(self):
         self.running = True
+        # int16 capture: PortAudio hands us the exact PCM format Vosk
+        # consumes, so the float32 -> int16 roundtrip disappears
         self.stream = sd.InputStream(
             samplerate=self.samplerate,
             channels=1,
-            dtype="float32",
+            dtype="int16",
             callback=self.audio_callback,
             blocksize=self.chunk_size
         )
@@ -41,44 +97,91 @@ class WakeSleepVosk:
         print("Microphone stream started...")
 
     def stop_stream(self):
-        self.running = False
+        # Sentinel shutdown: the listener decodes everything queued
+        # before this point, then exits on its own
+        self.q.append(_SENTINEL)
+        self.audio_ready.set()
         if self.stream:
             self.stream.stop()
             self.stream.close()
+        self.running = False
 
     def listener_loop(self):
         print("Listener loop started...")
-        while self.running:
-            if not self.q.empty():
-                data = self.q.get()
-                if self.recognizer.AcceptWaveform(data):
-                    result = json.loads(self.recognizer.Result())
-                    text = result.get("text", "").lower().strip()
-                    if not text:
-                        continue
-                    tokens = text.replace(".", "").replace(",", "").split()
-
-                    # Wake word detection
-                    if any(word in tokens for word in self.wake_words) and not self.active:
-                        print(f"Wake word detected: {tokens}")
+        while True:
+            # Pop lock-free; when empty, sleep on the event until the
+            # callback signals more audio
+            try:
+                item = self.q.popleft()
+            except IndexError:
+                if not self.running:
+                    break
+                self.audio_ready.wait(0.2)
+                self.audio_ready.clear()
+                continue
+            if item is _SENTINEL:
+                break
+            chunks = [item]
+            # Drain the rest of the backlog and decode it in a single
+            # AcceptWaveform call — same recognizer work, far fewer
+            # Python<->C crossings when the consumer falls behind
+            while True:
+                try:
+                    item = self.q.popleft()
+                except IndexError:
+                    break
+                if item is _SENTINEL:
+                    self.running = False
+                    break
+                chunks.append(item)
+            data = chunks[0] if len(chunks) == 1 else b"".join(chunks)
+            if not self.recognizer.AcceptWaveform(data):
+                if not self.active:
+                    # Check the partial hypothesis: the wake word fires
+                    # mid-utterance instead of waiting for the
+                    # finalization lattice, and the regex on the raw
+                    # JSON avoids building a dict per block while idle
+                    match = self._wake_re.search(self.recognizer.PartialResult())
+                    if match:
+                        print(f"Wake word detected: {match.group(0)}")
+                        self.recognizer.Reset()
+                        self.active = True
+            else:
+                raw = self.recognizer.Result()
+
+                # Wake word detection on the raw JSON — no parse needed
+                if not self.active:
+                    match = self._wake_re.search(raw)
+                    if match:
+                        print(f"Wake word detected: {match.group(0)}")
                         self.active = True
+                    continue
 
-                    # Sleep word detection
-                    elif any(word in tokens for word in self.sleep_words) and self.active:
-                        print(f"Sleep word detected: {tokens}")
-                        self.active = False
+                # Sleep word detection, likewise parse-free
+                match = self._sleep_re.search(raw)
+                if match:
+                    print(f"Sleep word detected: {match.group(0)}")
+                    self.active = False
+                    continue
 
-                    # Append to transcript if active
-                    if self.active:
-                        self.transcript_buffer.append(text)
-                        print("Transcript:", text)
+                # Storing a transcript is the one case that needs the
+                # parsed text
+                text = _json_loads(raw).get("text", "").lower().strip()
+                if not text:
+                    continue
+                with self._buf_lock:
+                    self.transcript_buffer.append(text)
+                print("Transcript:", text)
 
     def get_transcripts(self):
-        if self.transcript_buffer:
-            buffer_copy = self.transcript_buffer[:]
-            self.transcript_buffer = []
-            return buffer_copy
-        return []
+        if not self.transcript_buffer:
+            return []
+        # Swap the whole deque out under the lock instead of copying
+        # then clearing, which could drop lines appended in between
+        with self._buf_lock:
+            out = self.transcript_buffer
+            self.transcript_buffer = collections.deque()
+        return list(out)
 
     def terminate(self):
         self.stop_stream()
@@ -3,8 +3,9 @@ import wave
 import json
 import numpy as np
 from vosk import Model, KaldiRecognizer
+from functools import lru_cache
 from pydub import AudioSegment
-from scipy.signal import butter, lfilter
+from scipy.signal import butter, sosfilt
 
 # ---------------------------
 # CONFIGURATION
@@ -16,43 +17,46 @@ OUTPUT_FOLDER = "transcriptions"
 # ---------------------------
 # FUNCTION: Noise Reduction (High-pass filter)
 # ---------------------------
-def butter_highpass(cutoff, fs, order=5):
+@lru_cache(maxsize=8)
+def butter_highpass_sos(cutoff, fs, order=5):
+    # Second-order sections are numerically stable at higher orders;
+    # float32 coefficients keep the filter pass in single precision
     nyq = 0.5 * fs
     normal_cutoff = cutoff / nyq
-    b, a = butter(order, normal_cutoff, btype='high', analog=False)
-    return b, a
+    sos = butter(order, normal_cutoff, btype='high', analog=False, output='sos')
+    return sos.astype(np.float32)
 
 def highpass_filter(data, cutoff=100, fs=16000, order=5):
-    b, a = butter_highpass(cutoff, fs, order=order)
-    y = lfilter(b, a, data)
-    return y
+    sos = butter_highpass_sos(cutoff, fs, order)
+    # float32 halves the memory traffic of the float64 default
+    y = sosfilt(sos, data.astype(np.float32, copy=False))
+    np.clip(y, -32768, 32767, out=y)
+    return y.astype(np.int16, copy=False)
 
 # ---------------------------
 # LOAD AND PREPROCESS AUDIO
 # ---------------------------
-# Convert to mono 16kHz WAV using pydub
-audio = AudioSegment.from_file(AUDIO_PATH)
-audio = audio.set_channels(1).set_frame_rate(16000)
-preprocessed_path = "preprocessed.wav"
-audio.export(preprocessed_path, format="wav")
-
-# Open WAV
-wf = wave.open(preprocessed_path, "rb")
-
-# Read all frames
-frames = wf.readframes(wf.getnframes())
-audio_data = np.frombuffer(frames, dtype=np.int16)
+# Fast path: when the source is already 16 kHz mono 16-bit PCM (the
+# required format), read it in place — no ffmpeg subprocess, no
+# re-encode, no temporary file on disk
+audio_data = None
+try:
+    with wave.open(AUDIO_PATH, "rb") as wf:
+        if wf.getnchannels() == 1 and wf.getsampwidth() == 2 and wf.getframerate() == 16000:
+            audio_data = np.frombuffer(wf.readframes(wf.getnframes()), dtype=np.int16)
+except wave.Error:
+    pass
+
+if audio_data is None:
+    # Fallback: convert to mono 16kHz 16-bit via pydub, keeping the
+    # samples in memory instead of exporting a WAV and reopening it
+    audio = AudioSegment.from_file(AUDIO_PATH)
+    audio = audio.set_channels(1).set_frame_rate(16000).set_sample_width(2)
+    audio_data = np.frombuffer(audio.raw_data, dtype=np.int16)
 
 # Apply high-pass filter to remove low-frequency noise
+# (already clipped and converted to int16 inside the filter)
 filtered_data = highpass_filter(audio_data)
-filtered_data = filtered_data.astype(np.int16)
-
-# Save filtered audio back to WAV
-with wave.open(preprocessed_path, 'wb') as wf_f:
-    wf_f.setnchannels(1)
-    wf_f.setsampwidth(2)
-    wf_f.setframerate(16000)
-    wf_f.writeframes(filtered_data.tobytes())
 
 # ---------------------------
 # LOAD MODEL
@@ -64,19 +68,20 @@ model = Model(MODEL_PATH)
 # ---------------------------
 # TRANSCRIPTION
 # ---------------------------
-wf = wave.open(preprocessed_path, "rb")
-rec = KaldiRecognizer(model, wf.getframerate())
+rec = KaldiRecognizer(model, 16000)
+
+# The filtered samples are already in memory; slice them straight into
+# the recognizer instead of re-reading preprocessed.wav from disk.
+# 16000 frames (32000 bytes) per feed amortizes the Python/C boundary.
+CHUNK_BYTES = 16000 * 2
+filtered_bytes = filtered_data.tobytes()
 
 transcript = ""
-while True:
-    data = wf.readframes(4000)
-    if len(data) == 0:
-        break
+for offset in range(0, len(filtered_bytes), CHUNK_BYTES):
+    data = filtered_bytes[offset:offset + CHUNK_BYTES]
     if rec.AcceptWaveform(data):
         result = json.loads(rec.Result())
         transcript += result['text'] + " "
-    else:
-        partial = json.loads(rec.PartialResult())
 
 final_result = json.loads(rec.FinalResult())
 transcript += final_result['text']
@@ -17,6 +17,10 @@ async def websocket_endpoint(websocket: WebSocket):
     last_status = None  # track previous status
     try:
         while True:
+            # Sleep until the listener signals new transcripts; the
+            # timeout keeps wake/sleep status changes flowing promptly
+            await asyncio.to_thread(stt.new_transcript.wait, 0.5)
+
             transcripts = stt.get_transcripts()
             current_status = "transcribing" if stt.active else "idle"
 
@@ -38,8 +42,6 @@ async def websocket_endpoint(websocket: WebSocket):
                 }
                 await websocket.send_text(json.dumps(message))
                 last_status = current_status
-
-            await asyncio.sleep(0.1)
     except Exception as e:
         print("WebSocket disconnected:", e)
 
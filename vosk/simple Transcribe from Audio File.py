@@ -7,10 +7,14 @@ wf = wave.open("iot1.wav", "rb")
 
 rec = KaldiRecognizer(model, wf.getframerate())
 
-while True:
-    data = wf.readframes(4000)
-    if len(data) == 0:
-        break
+# Read the whole file once and feed fixed slices; readframes(4000) in a
+# loop pays a read() plus a bytes allocation per chunk
+raw = wf.readframes(wf.getnframes())
+view = memoryview(raw)
+CHUNK_BYTES = 16000 * 2
+
+for offset in range(0, len(raw), CHUNK_BYTES):
+    data = bytes(view[offset:offset + CHUNK_BYTES])
     if rec.AcceptWaveform(data):
         print(json.loads(rec.Result()))
 print(json.loads(rec.FinalResult()))
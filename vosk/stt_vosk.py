@@ -1,35 +1,93 @@
 import sounddevice as sd
-import queue
+import collections
 import json
+import re
 import threading
-import numpy as np
 from vosk import Model, KaldiRecognizer
 import time
 
+# orjson parses the recognizer's result strings several times faster
+# than the stdlib; fall back transparently when it is not installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Pushed through the audio deque on stop(); the listener drains every
+# block queued before it, then exits deterministically
+_SENTINEL = object()
+
+
 class WakeSleepVosk:
+    # Vosk models are hundreds of MB and take seconds to load; share
+    # one instance per path across recognizers and class instances
+    _model_cache = {}
+
+    @classmethod
+    def _load_model(cls, path):
+        model = cls._model_cache.get(path)
+        if model is None:
+            model = cls._model_cache.setdefault(path, Model(path))
+        return model
+
     def __init__(self, model_path="vosk-model-en-in-0.5", samplerate=16000, chunk_size=8000):
         self.model_path = model_path
         self.model = None
         self.recognizer = None
-        self.q = queue.Queue()
-        self.transcript_buffer = []
-        self.active = False
+        # Bounded deque: append/popleft are lock-free in CPython, so
+        # the realtime callback never takes a mutex; the Event wakes
+        # the listener thread
+        self.q = collections.deque(maxlen=64)
+        self.audio_ready = threading.Event()
+        # Swapped wholesale in get_transcripts, so handoff is O(1)
+        # and nothing appended mid-read is lost
+        self.transcript_buffer = collections.deque()
+        self._buf_lock = threading.Lock()
+        # Signals consumers (e.g. the websocket loop) that new
+        # transcripts are waiting, so they can block instead of polling
+        self.new_transcript = threading.Event()
+        # Event-backed flag: set()/clear()/is_set() are atomic across
+        # the listener and consumer threads
+        self._active = threading.Event()
         self.running = False
         self.samplerate = samplerate
         self.chunk_size = chunk_size
         self.stream = None
 
         # Wake listener (always on)
-        self.wake_model = Model(model_path)
+        self.wake_model = self._load_model(model_path)
         self.wake_recognizer = KaldiRecognizer(self.wake_model, samplerate)
-        self.wake_words = ["hi", "hey", "hai"]
-        self.sleep_words = ["bye", "goodbye", "by"]
+        # frozensets: membership tests against the token list become
+        # one hashed intersection instead of a nested scan
+        self.wake_words = frozenset(("hi", "hey", "hai"))
+        self.sleep_words = frozenset(("bye", "goodbye", "by"))
+        # Compiled once from the word sets and matched against the raw
+        # recognizer JSON, so wake/sleep detection never needs a full
+        # parse — json.loads runs only when a transcript is stored
+        self._wake_re = re.compile(r'\b(?:' + '|'.join(self.wake_words) + r')\b')
+        self._sleep_re = re.compile(r'\b(?:' + '|'.join(self.sleep_words) + r')\b')
+
+    @property
+    def active(self):
+        return self._active.is_set()
+
+    @active.setter
+    def active(self, value):
+        if value:
+            self._active.set()
+        else:
+            self._active.clear()
 
     # ---------------- AUDIO INPUT ---------------- #
     def audio_callback(self, indata, frames, time, status):
         if status:
             print(f"Audio status: {status}")
-        self.q.put((indata * 32767).astype(np.int16).tobytes())
+        # Stream already captures int16 PCM, so no per-block conversion;
+        # tobytes() on the contiguous block skips the buffer-protocol
+        # coercion that bytes(indata) goes through
+        self.q.append(indata.tobytes())
+        self.audio_ready.set()
 
     # ---------------- MAIN STREAM ---------------- #
     def start_listener(self):
@@ -37,10 +95,12 @@ class WakeSleepVosk:
         if self.running:
             return
         self.running = True
+        # int16 capture: PortAudio hands us the exact PCM format Vosk
+        # consumes, so the float32 -> int16 roundtrip disappears
         self.stream = sd.InputStream(
             samplerate=self.samplerate,
             channels=1,
-            dtype="float32",
+            dtype="int16",
             callback=self.audio_callback,
             blocksize=self.chunk_size,
         )
@@ -52,39 +112,71 @@ class WakeSleepVosk:
     def loop(self):
         """Unified loop handling both wake detection and conditional STT."""
         print("Listener loop started...")
-        while self.running:
-            if self.q.empty():
-                time.sleep(0.05)
+        while True:
+            try:
+                item = self.q.popleft()
+            except IndexError:
+                if not self.running:
+                    break
+                self.audio_ready.wait(0.2)
+                self.audio_ready.clear()
                 continue
-
-            data = self.q.get()
+            if item is _SENTINEL:
+                break
+            chunks = [item]
+            # Drain whatever else the callback has queued and feed it
+            # as one AcceptWaveform call: Vosk decodes streamed audio
+            # incrementally, so one big call costs the same decoding
+            # work with a fraction of the Python<->C crossings, and a
+            # backlog is cleared in one iteration instead of many
+            while True:
+                try:
+                    item = self.q.popleft()
+                except IndexError:
+                    break
+                if item is _SENTINEL:
+                    self.running = False
+                    break
+                chunks.append(item)
+            data = chunks[0] if len(chunks) == 1 else b"".join(chunks)
 
             # If inactive, only listen for wake word
             if not self.active:
                 if self.wake_recognizer.AcceptWaveform(data):
-                    result = json.loads(self.wake_recognizer.Result())
-                    text = result.get("text", "").lower()
-                    if any(w in text.split() for w in self.wake_words):
-                        print("Wake word detected:", text)
+                    match = self._wake_re.search(self.wake_recognizer.Result())
+                    if match:
+                        print("Wake word detected:", match.group(0))
+                        self.activate_stt()
+                else:
+                    # Check the partial hypothesis: the wake word fires
+                    # mid-utterance instead of waiting for the
+                    # finalization lattice, and the regex on the raw
+                    # JSON avoids building a dict per block while idle
+                    match = self._wake_re.search(self.wake_recognizer.PartialResult())
+                    if match:
+                        print("Wake word detected:", match.group(0))
+                        self.wake_recognizer.Reset()
                         self.activate_stt()
                 continue
 
             # If active, run full STT recognizer
             if self.recognizer and self.recognizer.AcceptWaveform(data):
-                result = json.loads(self.recognizer.Result())
-                text = result.get("text", "").lower()
-                if not text:
-                    continue
+                raw = self.recognizer.Result()
 
-                tokens = text.replace(".", "").split()
-
-                # Detect sleep command
-                if any(w in tokens for w in self.sleep_words):
-                    print("Sleep word detected:", text)
+                # Detect sleep command on the raw JSON: deactivation
+                # needs no parsed text
+                if self._sleep_re.search(raw):
+                    print("Sleep word detected")
                     self.deactivate_stt()
                     continue
 
-                self.transcript_buffer.append(text)
+                text = _json_loads(raw).get("text", "").lower()
+                if not text:
+                    continue
+
+                with self._buf_lock:
+                    self.transcript_buffer.append(text)
+                self.new_transcript.set()
                 print("Transcript:", text)
 
     # ---------------- STATE CONTROL ---------------- #
@@ -92,7 +184,9 @@ class WakeSleepVosk:
         """Start or resume the main STT model dynamically."""
         if not self.model:
             print("Loading main Vosk model...")
-            self.model = Model(self.model_path)
+            # Served from the class cache after the first activation,
+            # so resuming after a sleep word is instant
+            self.model = self._load_model(self.model_path)
             self.recognizer = KaldiRecognizer(self.model, self.samplerate)
         self.active = True
         print("STT Activated ✅")
@@ -105,14 +199,22 @@ class WakeSleepVosk:
         print("STT Deactivated 💤")
 
     def get_transcripts(self):
-        if self.transcript_buffer:
-            temp = self.transcript_buffer[:]
-            self.transcript_buffer = []
-            return temp
-        return []
+        self.new_transcript.clear()
+        if not self.transcript_buffer:
+            return []
+        # Swap the whole deque out under the lock instead of copying
+        # then clearing, which could drop lines appended in between
+        with self._buf_lock:
+            out = self.transcript_buffer
+            self.transcript_buffer = collections.deque()
+        return list(out)
 
     def stop(self):
-        self.running = False
+        # Sentinel shutdown: the listener decodes everything queued
+        # before this point, then exits on its own
+        self.q.append(_SENTINEL)
+        self.audio_ready.set()
         if self.stream:
             self.stream.stop()
             self.stream.close()
+        self.running = False
@@ -1,14 +1,62 @@
+import hashlib
+import os
+import shutil
+
 import pyttsx3
-import wave
 
-# Initialize text-to-speech engine
+# Content-addressed synthesis cache: repeated prompts ("Hello", status
+# phrases) skip the TTS pipeline entirely and cost one file copy
+CACHE_DIR = "cache"
+
+# Initialize text-to-speech engine once at module scope; driver init
+# (SAPI/espeak) costs tens of ms, so callers reuse this engine instead
+# of paying it per synthesis
 engine = pyttsx3.init()
 engine.setProperty("rate", 150)  # speaking speed
 engine.setProperty("voice", engine.getProperty("voices")[0].id)  # default voice
 
-# Save spoken text to WAV file
-filename_tts = "iot1.wav"
-engine.save_to_file("Hello, my name is Aditya, We are going to present a Iot Device that can summarize meetings and lectures and present you in summarise key points", filename_tts)
-engine.runAndWait()
 
-filename_tts
+def _cache_path(text):
+    key = hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+    return os.path.join(CACHE_DIR, f"{key}.wav")
+
+
+def tts(text, path):
+    """Synthesize one utterance to a WAV file on the shared engine.
+
+    Renders into the content-addressed cache keyed by the text hash;
+    identical utterances are served from disk without re-synthesis.
+    """
+    cached = _cache_path(text)
+    if not os.path.exists(cached):
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        engine.save_to_file(text, cached)
+        engine.runAndWait()
+    shutil.copyfile(cached, path)
+
+
+def tts_batch(items):
+    """Synthesize many (text, path) pairs in one driver session.
+
+    Cache misses are queued first so a single runAndWait processes
+    them all instead of spinning the driver loop once per utterance;
+    hits and the final delivery are plain file copies.
+    """
+    misses = []
+    for text, path in items:
+        cached = _cache_path(text)
+        if not os.path.exists(cached):
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            engine.save_to_file(text, cached)
+            misses.append(cached)
+    if misses:
+        engine.runAndWait()
+    for text, path in items:
+        shutil.copyfile(_cache_path(text), path)
+
+
+if __name__ == "__main__":
+    tts(
+        "Hello, my name is Aditya, We are going to present a Iot Device that can summarize meetings and lectures and present you in summarise key points",
+        "iot1.wav",
+    )